@@ -1,6 +1,11 @@
 import asyncio
-import inspect
-from typing import Callable, Any, List, Tuple
+from types import TracebackType
+from typing import Callable, Any, Dict, List, Optional, Tuple, Type
+
+_Step = Tuple[Callable[..., Any], Tuple[Any, ...], Optional[Dict[str, Any]], bool]
+
+_ROLLBACK_METHODS = ("do_rollback", "do_rollback_sync")
+_iscoroutinefunction = asyncio.iscoroutinefunction
 
 
 class Rollback:
@@ -8,6 +13,16 @@ class Rollback:
     Provides rollback methods and context manager.
     """
 
+    __slots__ = (
+        "steps",
+        "on_error",
+        "on_success",
+        "raise_error",
+        "_rollback_ran",
+        "_n_coro_steps",
+        "__weakref__",
+    )
+
     def __init__(self, on_error: bool = False, on_success: bool = False, raise_error: bool = True):
         """
         Initializes the Rollback instance.
@@ -16,10 +31,12 @@ class Rollback:
         :param on_success: Call `do_rollback` if no exception is raised.
         :param raise_error: Re-raise exceptions if they are raised during the context manager block.
         """
-        self.steps: List[Tuple[Callable[..., Any], Tuple[Any, ...], dict]] = []
+        self.steps: List[_Step] = []
         self.on_error = on_error
         self.on_success = on_success
         self.raise_error = raise_error
+        self._rollback_ran = False
+        self._n_coro_steps = 0
 
     def __enter__(self) -> 'Rollback':
         """
@@ -37,7 +54,12 @@ class Rollback:
         """
         return self
 
-    def __exit__(self, exception_type, exception_value, traceback):
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
         """
         Exits the context manager block.
 
@@ -46,9 +68,14 @@ class Rollback:
         :param traceback: Traceback of the raised exception.
         :return: Whether to suppress the raised exception.
         """
-        return self._handle_exit(exception_type, exception_value, traceback)
+        return self._handle_exit_sync(exception_type, exception_value, traceback)
 
-    async def __aexit__(self, exception_type, exception_value, traceback):
+    async def __aexit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
         """
         Exits the async context manager block.
 
@@ -57,9 +84,14 @@ class Rollback:
         :param traceback: Traceback of the raised exception.
         :return: Whether to suppress the raised exception.
         """
-        return await self._handle_exit(exception_type, exception_value, traceback)
+        return await self._handle_exit_async(exception_type, exception_value, traceback)
 
-    def _handle_exit(self, exception_type, exception_value, traceback):
+    def _handle_exit_sync(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
         """
         Handles the exit process for the context manager.
 
@@ -68,47 +100,99 @@ class Rollback:
         :param traceback: Traceback of the raised exception.
         :return: Whether to suppress the raised exception.
         """
-        error = bool(traceback is not None)
-        suppress_error = not self.raise_error
+        if not (self.on_error or self.on_success):
+            return self._suppress_error(traceback)
+        error = traceback is not None
         if (error and self.on_error) or (self.on_success and not error):
-            if asyncio.get_event_loop().is_running():
-                asyncio.create_task(self.do_rollback())
-            else:
+            if not self._n_coro_steps:
+                self.do_rollback_sync()
+                return self._suppress_error(traceback)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
                 asyncio.run(self.do_rollback())
-        if error and suppress_error:
-            suppress_error = not self._method_in_traceback("do_rollback", traceback)
-        return suppress_error
+            else:
+                if any(step[3] for step in self.steps):
+                    raise RuntimeError(
+                        "Cannot roll back coroutine steps from a sync context manager inside a "
+                        "running event loop, use `async with Rollback(...)` instead"
+                    )
+                # The steps were changed directly, leaving the counter stale.
+                self._n_coro_steps = 0
+                self.do_rollback_sync()
+        return self._suppress_error(traceback)
 
-    @staticmethod
-    def _frames(traceback):
+    async def _handle_exit_async(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> bool:
         """
-        Returns a generator that iterates over frames in a traceback.
+        Handles the exit process for the async context manager.
 
-        :param traceback: The traceback object.
-        :return: Generator for frames in the traceback.
+        :param exception_type: Type of the raised exception.
+        :param exception_value: Value of the raised exception.
+        :param traceback: Traceback of the raised exception.
+        :return: Whether to suppress the raised exception.
+        """
+        if not (self.on_error or self.on_success):
+            return self._suppress_error(traceback)
+        error = traceback is not None
+        if (error and self.on_error) or (self.on_success and not error):
+            await self.do_rollback()
+        return self._suppress_error(traceback)
+
+    def _suppress_error(self, traceback: Optional[TracebackType]) -> bool:
         """
-        frame = traceback
-        while frame.tb_next:
-            frame = frame.tb_next
-            yield frame.tb_frame
+        Checks if the raised exception should be suppressed.
+
+        Errors raised by rollback steps are never suppressed.
 
-    def _method_in_traceback(self, name: str, traceback) -> bool:
+        :param traceback: Traceback of the raised exception.
+        :return: Whether to suppress the raised exception.
+        """
+        if traceback is None or self.raise_error:
+            return False
+        if self._may_have_rolled_back():
+            return not self._method_in_traceback(_ROLLBACK_METHODS, traceback)
+        return True
+
+    def _may_have_rolled_back(self) -> bool:
+        """
+        Checks if a rollback method may be the origin of the raised exception.
+
+        Subclasses overriding the rollback methods may raise before the base
+        implementation runs, so the traceback is always checked for them.
+
+        :return: True if the traceback needs to be checked, otherwise False.
+        """
+        cls = type(self)
+        return (
+            self._rollback_ran
+            or cls.do_rollback is not Rollback.do_rollback
+            or cls.do_rollback_sync is not Rollback.do_rollback_sync
+        )
+
+    def _method_in_traceback(
+        self, names: Tuple[str, ...], traceback: TracebackType
+    ) -> bool:
         """
         Checks if a method from this instance is present in the traceback.
 
-        :param name: The name of the method to check.
+        :param names: The names of the methods to check.
         :param traceback: The traceback object.
         :return: True if the method is found, otherwise False.
         """
-        found_method = False
-        for frame in self._frames(traceback):
-            this = frame.f_locals.get("self")
-            if this is self and frame.f_code.co_name == name:
-                found_method = True
-                break
-        return found_method
+        tb = traceback.tb_next
+        while tb is not None:
+            frame = tb.tb_frame
+            if frame.f_code.co_name in names and frame.f_locals.get("self") is self:
+                return True
+            tb = tb.tb_next
+        return False
 
-    def add_step(self, callback: Callable[..., Any], *args: Any, **kwargs: Any):
+    def add_step(self, callback: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
         """
         Adds a rollback step with optional arguments.
 
@@ -116,21 +200,102 @@ class Rollback:
         :param args: Positional arguments for the callback.
         :param kwargs: Keyword arguments for the callback.
         """
-        self.steps.append((callback, args, kwargs))
+        is_coro = _iscoroutinefunction(callback)
+        self.steps.append((callback, args, kwargs or None, is_coro))
+        if is_coro:
+            self._n_coro_steps += 1
+
+    def bind(self, callback: Callable[..., Any]) -> Callable[..., None]:
+        """
+        Returns a function that adds rollback steps for a fixed callback.
 
-    def clear_steps(self):
+        :param callback: The callback function for the rollback steps.
+        :return: A function taking the callback arguments and adding a rollback step.
+        """
+        is_coro = _iscoroutinefunction(callback)
+
+        def add_step(*args: Any, **kwargs: Any) -> None:
+            self.steps.append((callback, args, kwargs or None, is_coro))
+            if is_coro:
+                self._n_coro_steps += 1
+
+        return add_step
+
+    def clear_steps(self) -> None:
         """
         Clears all rollback steps.
         """
         self.steps.clear()
+        self._n_coro_steps = 0
+
+    def reset(self) -> "Rollback":
+        """
+        Clears all rollback steps and state so the instance can be reused.
 
-    async def do_rollback(self):
+        Reusing one instance for many short transactions avoids allocating a new
+        Rollback per transaction, e.g. ``with rollback.reset():``.
+
+        :return: The current Rollback instance.
+        """
+        self.clear_steps()
+        self._rollback_ran = False
+        return self
+
+    async def do_rollback(self, parallel: bool = False) -> None:
         """
         Calls each rollback step in LIFO order asynchronously if the step is a coroutine.
+
+        :param parallel: Await consecutive coroutine steps concurrently. Every step of a
+            concurrent batch finishes before the first error of the batch is re-raised.
         """
-        while self.steps:
-            callback, args, kwargs = self.steps.pop()
-            if asyncio.iscoroutinefunction(callback):
-                await callback(*args, **kwargs)
-            else:
+        self._rollback_ran = True
+        steps = self.steps
+        pop = steps.pop
+        while steps:
+            callback, args, kwargs, is_coro = pop()
+            if not is_coro:
+                if kwargs:
+                    callback(*args, **kwargs)
+                else:
+                    callback(*args)
+                continue
+            self._n_coro_steps -= 1
+            coro = callback(*args, **kwargs) if kwargs else callback(*args)
+            if not parallel:
+                await coro
+                continue
+            batch = [coro]
+            try:
+                while steps and steps[-1][3]:
+                    callback, args, kwargs, _ = pop()
+                    self._n_coro_steps -= 1
+                    batch.append(
+                        callback(*args, **kwargs) if kwargs else callback(*args)
+                    )
+            except BaseException:
+                for coro in batch:
+                    coro.close()
+                raise
+            for result in await asyncio.gather(*batch, return_exceptions=True):
+                if isinstance(result, BaseException):
+                    raise result
+
+    def do_rollback_sync(self) -> None:
+        """
+        Calls each rollback step in LIFO order without an event loop.
+
+        :raises RuntimeError: If a pending rollback step is a coroutine.
+        """
+        self._rollback_ran = True
+        steps = self.steps
+        pop = steps.pop
+        while steps:
+            if steps[-1][3]:
+                raise RuntimeError(
+                    "Cannot call a coroutine rollback step synchronously, use do_rollback instead"
+                )
+            callback, args, kwargs, _ = pop()
+            if kwargs:
                 callback(*args, **kwargs)
+            else:
+                callback(*args)
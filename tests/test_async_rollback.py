@@ -1,3 +1,4 @@
+import asyncio
 from unittest import mock
 import pytest
 
@@ -122,3 +123,104 @@ class TestRollback:
         rollback.add_step(self.mock_step)
         rollback.do_rollback()
         self.mock_step.assert_called_once_with()
+
+    async def test_Rollback_awaits_rollback_on_async_exit(self):
+        async_step = mock.AsyncMock()
+        async with Rollback(on_success=True) as rollback:
+            rollback.add_step(async_step)
+        async_step.assert_awaited_once_with()
+
+    async def test_Rollback_awaited_do_rollback_raises_error(self):
+        with pytest.raises(RollbackError):
+            async with Rollback(raise_error=False) as rollback:
+
+                def doError():
+                    raise RollbackError("test")
+
+                rollback.add_step(doError)
+                await rollback.do_rollback()
+
+    async def test_Rollback_bind_adds_coroutine_steps(self):
+        async_step = mock.AsyncMock()
+        async with Rollback(on_success=True) as rollback:
+            rollback.bind(async_step)(1)
+        async_step.assert_awaited_once_with(1)
+
+    async def test_Rollback_do_rollback_parallel_keeps_sync_order(self):
+        calls = []
+
+        async def async_step(idx):
+            calls.append(idx)
+
+        rollback = Rollback()
+        rollback.add_step(async_step, 0)
+        rollback.add_step(calls.append, 1)
+        rollback.add_step(async_step, 2)
+        rollback.add_step(async_step, 3)
+        rollback.add_step(calls.append, 4)
+        await rollback.do_rollback(parallel=True)
+        assert calls[0] == 4
+        assert sorted(calls[1:3]) == [2, 3]
+        assert calls[3:] == [1, 0]
+        assert rollback.steps == []
+
+    async def test_Rollback_sync_exit_with_coroutine_steps_raises_error(self):
+        async_step = mock.AsyncMock()
+        with pytest.raises(RuntimeError):
+            with Rollback(on_success=True) as rollback:
+                rollback.add_step(async_step)
+        async_step.assert_not_called()
+
+    async def test_Rollback_do_rollback_parallel_waits_for_batch_on_error(self):
+        calls = []
+
+        async def async_step(idx):
+            await asyncio.sleep(0.01)
+            calls.append(idx)
+
+        async def async_error():
+            raise RollbackError("test")
+
+        rollback = Rollback()
+        rollback.add_step(calls.append, 0)
+        rollback.add_step(async_step, 1)
+        rollback.add_step(async_error)
+        rollback.add_step(async_step, 2)
+        with pytest.raises(RollbackError):
+            await rollback.do_rollback(parallel=True)
+        assert sorted(calls) == [1, 2]
+        assert len(rollback.steps) == 1
+
+    async def test_Rollback_do_rollback_parallel_closes_batch_on_call_error(self):
+        async_step = mock.AsyncMock()
+
+        async def async_error(idx):
+            pass
+
+        rollback = Rollback()
+        rollback.add_step(async_error)
+        rollback.add_step(async_step)
+        with pytest.raises(TypeError):
+            await rollback.do_rollback(parallel=True)
+        async_step.assert_not_awaited()
+
+    async def test_Rollback_counts_coroutine_steps(self):
+        rollback = Rollback()
+        rollback.add_step(mock.AsyncMock())
+        rollback.add_step(self.mock_step)
+        rollback.add_step(mock.AsyncMock())
+        assert rollback._n_coro_steps == 2
+        await rollback.do_rollback()
+        assert rollback._n_coro_steps == 0
+        rollback.add_step(mock.AsyncMock())
+        assert rollback._n_coro_steps == 1
+        rollback.clear_steps()
+        assert rollback._n_coro_steps == 0
+
+    async def test_Rollback_sync_exit_ignores_stale_coroutine_step_count(self):
+        with Rollback(on_success=True) as rollback:
+            rollback.add_step(mock.AsyncMock())
+            rollback.steps.clear()
+            rollback.add_step(self.mock_step)
+        self.mock_step.assert_called_once_with()
+        assert rollback._n_coro_steps == 0
@@ -1,3 +1,4 @@
+import weakref
 from unittest import mock
 import pytest
 
@@ -122,3 +123,71 @@ class TestRollback:
         rollback.add_step(self.mock_step)
         rollback.do_rollback()
         self.mock_step.assert_called_once_with()
+
+    def test_Rollback_do_rollback_sync_calls_in_reverse_order(self):
+        idx_max = 3
+        expected_calls = list(reversed([mock.call(idx) for idx in range(idx_max)]))
+        with Rollback() as rollback:
+            for idx in range(idx_max):
+                rollback.add_step(self.mock_step, idx)
+            rollback.do_rollback_sync()
+        assert self.mock_step.mock_calls == expected_calls
+
+    def test_Rollback_do_rollback_sync_raises_error_on_coroutine_step(self):
+        async def step():
+            pass
+
+        rollback = Rollback()
+        rollback.add_step(step)
+        with pytest.raises(RuntimeError):
+            rollback.do_rollback_sync()
+        assert len(rollback.steps) == 1
+
+    def test_Rollback_do_rollback_sync_raises_error(self):
+        with pytest.raises(RollbackError):
+            with Rollback(raise_error=False) as rollback:
+
+                def doError():
+                    raise RollbackError("test")
+
+                rollback.add_step(doError)
+                rollback.do_rollback_sync()
+
+    def test_Rollback_do_rollback_sync_passes_kwargs(self):
+        rollback = Rollback()
+        rollback.add_step(self.mock_step, 1, key="value")
+        rollback.do_rollback_sync()
+        self.mock_step.assert_called_once_with(1, key="value")
+
+    def test_Rollback_bind_adds_steps(self):
+        with Rollback(on_success=True) as rollback:
+            add_step = rollback.bind(self.mock_step)
+            add_step(1)
+            add_step(2, key="value")
+        assert self.mock_step.mock_calls == [mock.call(2, key="value"), mock.call(1)]
+
+    def test_Rollback_reset_allows_reuse(self):
+        rollback = Rollback(on_success=True)
+        with rollback.reset() as reused:
+            assert reused is rollback
+            reused.add_step(self.mock_step, 1)
+        with rollback.reset():
+            rollback.add_step(self.mock_step, 2)
+            rollback.reset()
+        self.mock_step.assert_called_once_with(1)
+        assert rollback.steps == []
+        assert rollback._rollback_ran is True
+        rollback.reset()
+        assert rollback._rollback_ran is False
+
+    def test_Rollback_supports_weak_references(self):
+        rollback = Rollback()
+        assert weakref.ref(rollback)() is rollback
+
+    def test_Rollback_bind_uses_reassigned_steps(self):
+        rollback = Rollback()
+        add_step = rollback.bind(self.mock_step)
+        rollback.steps = []
+        add_step(1)
+        rollback.do_rollback_sync()
+        self.mock_step.assert_called_once_with(1)